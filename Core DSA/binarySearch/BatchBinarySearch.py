@@ -0,0 +1,127 @@
+# Problem: Given a sorted array and many target values, answer binary_search / lower_bound for all of them in one call.
+
+# Calling binary_search once per target pays the Python function call and loop setup for every lookup.
+# When the targets are sorted, their lower bounds are also sorted, so one forward sweep over the array
+# answers all of them (like the merge step of merge sort). When they are not sorted we sort their
+# positions once, sweep, and put the answers back in the original order. If NumPy arrays are passed in,
+# numpy.searchsorted does the whole batch in C.
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python sweep is always available
+    np = None
+
+
+def binary_search(arr, target):
+    left, right = 0, len(arr) - 1
+    while left <= right:
+        mid = left + (right - left) // 2
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+
+def lower_bound(arr, target):
+    left, right = 0, len(arr)
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def is_sorted(values):
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+
+def gallop_lower_bound(arr, target, start):
+    # Lower bound of target in arr[start:], probing start+1, start+2, start+4, start+8, ... before the binary search.
+    # Close targets cost O(1) probes, far targets cost O(log distance).
+    n = len(arr)
+    if start >= n or not arr[start] < target:
+        return start
+    step = 1
+    left = start + 1
+    right = start + step
+    while right < n and arr[right] < target:
+        left = right + 1
+        step *= 2
+        right = start + step
+    if right > n:
+        right = n
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def sorted_sweep_lower_bound(arr, targets):
+    # Targets are sorted, so each answer starts where the previous one stopped.
+    result = []
+    pos = 0
+    for target in targets:
+        pos = gallop_lower_bound(arr, target, pos)
+        result.append(pos)
+    return result
+
+
+def batch_lower_bound(arr, targets):
+    if np is not None and isinstance(arr, np.ndarray) and isinstance(targets, np.ndarray):
+        return np.searchsorted(arr, targets, side="left").tolist()
+
+    if is_sorted(targets):
+        return sorted_sweep_lower_bound(arr, targets)
+
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+    positions = sorted_sweep_lower_bound(arr, [targets[i] for i in order])
+    result = [0] * len(targets)
+    for i, pos in zip(order, positions):
+        result[i] = pos
+    return result
+
+
+def batch_binary_search(arr, targets):
+    n = len(arr)
+    result = []
+    for target, pos in zip(targets, batch_lower_bound(arr, targets)):
+        if pos == n or arr[pos] != target:
+            result.append(-1)
+        elif pos + 1 < n and arr[pos + 1] == target:
+            # Duplicates: binary_search may stop on any copy, so ask it directly to return the same index.
+            result.append(binary_search(arr, target))
+        else:
+            result.append(pos)
+    return result
+
+# Example
+arr = [1, 3, 5, 7, 9, 11]
+targets = [7, 0, 11, 4, 1]
+print(batch_binary_search(arr, targets))  # Output: [3, -1, 5, -1, 0]
+print(batch_lower_bound(arr, targets))    # Output: [3, 0, 5, 2, 0]
+print(batch_lower_bound(arr, [2, 5, 8, 12]))  # Output: [1, 2, 4, 6]
+
+# Check against the single target functions
+arr = [1, 2, 2, 2, 3, 5, 5, 8, 13, 13, 13, 21]
+targets = list(range(-1, 23)) + [13, 2, 5, 0]
+print(batch_binary_search(arr, targets) == [binary_search(arr, t) for t in targets])  # Output: True
+print(batch_lower_bound(arr, targets) == [lower_bound(arr, t) for t in targets])      # Output: True
+
+
+# Time Complexity Analysis (Big-O Notation)
+#    - n = len(arr), m = len(targets).
+#    - Sorted targets: one sweep, O(m log(n/m + 1)) thanks to galloping, never worse than O(n + m).
+#    - Unsorted targets: O(m log m) to sort the positions plus the sweep above.
+#    - NumPy arrays: numpy.searchsorted, O(m log n) but done in C.
+#    - Arrays with duplicates fall back to binary_search only for targets that have more than one copy.
+
+# Space Complexity
+#    - O(m) for the result list (and the sort order when targets are unsorted).
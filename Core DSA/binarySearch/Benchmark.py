@@ -0,0 +1,250 @@
+# Benchmark for every function in this folder, over array sizes from 10^3 up to 10^8.
+
+# For each function and size it reports:
+#   - ns/op:     average time of one call, the median of `repeat` timing runs
+#   - probes/op: average number of array reads (arr[i]) per call, counted on a separate run
+# and, where Python has a ready-made counterpart (bisect, math.isqrt), the same numbers for it.
+# Results are saved as JSON. Passing --compare old.json prints every case that got slower than the given
+# threshold since that run, so regressions show up between runs. Single runs of a few ms jitter by 20-30%
+# from scheduling and frequency scaling, so the median of 7 runs is compared and only a slowdown above 25%
+# counts as a regression.
+#
+# Usage:
+#   python Benchmark.py                          # sizes 10^3 .. 10^6, writes bench_results.json
+#   python Benchmark.py --max-exp 8 --out today.json --compare yesterday.json
+#
+# Sorted inputs are range objects (indexable in C, no memory used), so even 10^8 elements are cheap.
+# Rotated and peak inputs must be real arrays, so they are built as array('q'): 800 MB at 10^8.
+
+import argparse
+import bisect
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import runpy
+import statistics
+import time
+from array import array
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load(filename, *names):
+    # The scripts print their examples when run, so hide that output.
+    with contextlib.redirect_stdout(io.StringIO()):
+        namespace = runpy.run_path(os.path.join(HERE, filename))
+    return [namespace[name] for name in names]
+
+
+binary_search, = load("BasicBinarySearch.py", "binary_search")
+first_occurrence, last_occurrence, count_occurrences = load(
+    "CountOccurrencesOfA_Number.py", "first_occurrence", "last_occurrence", "count_occurrences")
+lower_bound, = load("InsertInSortedArray(LowerBound).py", "lower_bound")
+search_rotated, = load("SearchRotatedSortedArray.py", "search_rotated")
+find_min, = load("MinimumInRotatedSortedArray.py", "find_min")
+find_peak, = load("FindPeakElement.py", "find_peak")
+find_missing, = load("SmallestMissingPositiveNumber.py", "find_missing")
+sqrt_binary_search, = load("SquareRootusingBinarySearch.py", "sqrt_binary_search")
+
+
+class ProbeCounter:
+    # Wraps a sequence and counts arr[i] reads
+    def __init__(self, data):
+        self.data = data
+        self.probes = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        self.probes += 1
+        return self.data[i]
+
+
+# Counterparts from the standard library
+def bisect_search(arr, target):
+    i = bisect.bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
+
+
+def bisect_first(arr, target):
+    return bisect_search(arr, target)
+
+
+def bisect_last(arr, target):
+    i = bisect.bisect_right(arr, target) - 1
+    return i if i >= 0 and arr[i] == target else -1
+
+
+def bisect_count(arr, target):
+    return bisect.bisect_right(arr, target) - bisect.bisect_left(arr, target)
+
+
+def make_cases(n, queries, rng):
+    sorted_arr = range(0, 2 * n, 2)                    # 0, 2, 4, ...: half the targets are missing
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+    pivot = rng.randrange(n)
+    rotated = array("q", range(pivot, n))
+    rotated.extend(range(pivot))
+    top = rng.randrange(n)
+    mountain = array("q", range(top))
+    mountain.extend(range(n, top, -1))
+    missing = range(1, n + 1)
+    roots = [rng.randrange(n * n) for _ in range(queries)]
+
+    # name: (function, counterpart, array, list of query arguments)
+    return {
+        "binary_search": (binary_search, bisect_search, sorted_arr, targets),
+        "first_occurrence": (first_occurrence, bisect_first, sorted_arr, targets),
+        "last_occurrence": (last_occurrence, bisect_last, sorted_arr, targets),
+        "count_occurrences": (count_occurrences, bisect_count, sorted_arr, targets),
+        "lower_bound": (lower_bound, bisect.bisect_left, sorted_arr, targets),
+        "search_rotated": (search_rotated, None, rotated, targets[::2]),
+        "find_min": (find_min, None, rotated, None),
+        "find_peak": (find_peak, None, mountain, None),
+        "find_missing": (find_missing, None, missing, None),
+        "sqrt_binary_search": (sqrt_binary_search, math.isqrt, None, roots),
+    }
+
+
+def time_calls(fn, arr, args, repeat):
+    # Median of `repeat` runs, in ns per call (less sensitive to one lucky or unlucky run than the best or the mean)
+    if args is None:
+        calls = 1000
+        run = lambda: [fn(arr) for _ in range(calls)]
+    elif arr is None:
+        calls = len(args)
+        run = lambda: [fn(x) for x in args]
+    else:
+        calls = len(args)
+        run = lambda: [fn(arr, x) for x in args]
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run()
+        times.append(time.perf_counter_ns() - start)
+    return statistics.median(times) / calls
+
+
+def count_probes(fn, arr, args, sample=200):
+    if arr is None:  # sqrt_binary_search does not read an array
+        return None
+    counter = ProbeCounter(arr)
+    if args is None:
+        fn(counter)
+        return counter.probes
+    sample_args = args[:sample]
+    for x in sample_args:
+        fn(counter, x)
+    return counter.probes / len(sample_args)
+
+
+def check(fn, other, arr, args):
+    # The counterpart must give the same answers, otherwise the comparison means nothing
+    if other is None:
+        return
+    for x in args[:200]:
+        mine = fn(x) if arr is None else fn(arr, x)
+        theirs = other(x) if arr is None else other(arr, x)
+        if mine != theirs:
+            raise AssertionError(f"{fn.__name__} and {other.__name__} disagree on {x}: {mine} != {theirs}")
+
+
+def baseline_name(fn):
+    module = fn.__module__.lstrip("_")  # bisect functions live in the C module _bisect
+    if module in ("bisect", "math"):
+        return f"{module}.{fn.__name__}"
+    return fn.__name__
+
+
+def run(min_exp, max_exp, queries, repeat, seed):
+    rng = random.Random(seed)
+    results = []
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        for name, (fn, other, arr, args) in make_cases(n, queries, rng).items():
+            check(fn, other, arr, args)
+            row = {
+                "function": name,
+                "n": n,
+                "ns_per_op": round(time_calls(fn, arr, args, repeat), 1),
+                "probes_per_op": count_probes(fn, arr, args),
+                "baseline": None,
+            }
+            if other is not None:
+                row["baseline"] = {
+                    "function": baseline_name(other),
+                    "ns_per_op": round(time_calls(other, arr, args, repeat), 1),
+                    "probes_per_op": count_probes(other, arr, args),
+                }
+            results.append(row)
+            print_row(row)
+    return results
+
+
+def print_row(row):
+    probes = "-" if row["probes_per_op"] is None else f"{row['probes_per_op']:.1f}"
+    line = f"{row['function']:<20} n=10^{round(math.log10(row['n'])):<2} {row['ns_per_op']:>12.1f} ns/op {probes:>7} probes/op"
+    base = row["baseline"]
+    if base is not None:
+        base_probes = "-" if base["probes_per_op"] is None else f"{base['probes_per_op']:.1f}"
+        line += f"   | {base['function']:<20} {base['ns_per_op']:>10.1f} ns/op {base_probes:>7} probes/op"
+    print(line)
+
+
+def compare(results, old_path, threshold):
+    with open(old_path) as f:
+        report = json.load(f)
+    if report["settings"].get("statistic") != "median":
+        print(f"note: {old_path} holds best-of-N timings, not medians; expect spurious regressions")
+    old = {(row["function"], row["n"]): row for row in report["results"]}
+    regressions = 0
+    for row in results:
+        before = old.get((row["function"], row["n"]))
+        if before is None:
+            continue
+        ratio = row["ns_per_op"] / before["ns_per_op"]
+        if ratio > 1 + threshold:
+            regressions += 1
+            print(f"REGRESSION {row['function']} n={row['n']}: {before['ns_per_op']} -> {row['ns_per_op']} ns/op ({ratio:.2f}x)")
+        if row["probes_per_op"] != before["probes_per_op"]:
+            print(f"PROBES CHANGED {row['function']} n={row['n']}: {before['probes_per_op']} -> {row['probes_per_op']}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the binary search functions")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size is 10^min_exp")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size is 10^max_exp (up to 8)")
+    parser.add_argument("--queries", type=int, default=2000, help="queries per function and size")
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs, the median is kept")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown reported as a regression")
+    args = parser.parse_args()
+
+    results = run(args.min_exp, args.max_exp, args.queries, args.repeat, args.seed)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": {"queries": args.queries, "repeat": args.repeat, "seed": args.seed, "statistic": "median"},
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"saved {len(results)} results to {args.out}")
+
+    if args.compare:
+        if compare(results, args.compare, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
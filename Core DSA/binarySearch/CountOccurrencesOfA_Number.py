@@ -1,5 +1,7 @@
 # Problem: Given a sorted array, find the number of occurrences of a given element.
 
+import bisect
+
 def first_occurrence(arr, target):
     left, right = 0, len(arr) - 1
     result = -1
@@ -42,14 +44,107 @@ print(last_occurrence(arr, target))  # Output: 3
 
 
 
+def equal_range(arr, target):
+    # Returns (first, last + 1): the range of indexes holding target, (i, i) when it is missing.
+    # Both searches go down the same path until the first probe that hits target,
+    # so that shared part is done once and only the two ends are searched separately.
+    left, right = 0, len(arr)
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        elif arr[mid] > target:
+            right = mid
+        else:
+            # Lower end is in [left, mid], upper end is in [mid + 1, right]
+            lo, hi = left, mid
+            while lo < hi:
+                m = lo + (hi - lo) // 2
+                if arr[m] < target:
+                    lo = m + 1
+                else:
+                    hi = m
+            first = lo
+            lo, hi = mid + 1, right
+            while lo < hi:
+                m = lo + (hi - lo) // 2
+                if arr[m] > target:
+                    hi = m
+                else:
+                    lo = m + 1
+            return first, lo
+    return left, left
+
+# Example
+arr = [1, 2, 2, 2, 3, 4, 5]
+print(equal_range(arr, 2))  # Output: (1, 4)
+print(equal_range(arr, 6))  # Output: (7, 7)
+
+
 def count_occurrences(arr, target):
-    first = first_occurrence(arr, target)
-    if first == -1:
-        return 0
-    last = last_occurrence(arr, target)
-    return last - first + 1
+    first, end = equal_range(arr, target)
+    return end - first
 
 # Example
 arr = [1, 2, 2, 2, 3, 4, 5]
 target = 2
 print(count_occurrences(arr, target))  # Output: 3
+
+
+# Run-length index: when the same array is asked many count questions, store each distinct value once
+# with its count. A heavily duplicated array becomes much smaller, and counting no longer looks at the array.
+
+
+class RunLengthIndex:
+    def __init__(self, arr):
+        self.values = []    # distinct values, sorted
+        self.starts = [0]   # starts[i] = index of the first copy of values[i]; starts[-1] = len(arr)
+        self.counts = {}    # value -> number of copies
+        for x in arr:
+            if self.values and self.values[-1] == x:
+                self.counts[x] += 1
+            else:
+                if self.values:
+                    self.starts.append(self.starts[-1] + self.counts[self.values[-1]])
+                self.values.append(x)
+                self.counts[x] = 1
+        if self.values:
+            self.starts.append(self.starts[-1] + self.counts[self.values[-1]])
+
+    def count(self, target):
+        # O(1)
+        return self.counts.get(target, 0)
+
+    def count_in_range(self, low, high):
+        # Number of elements with low <= x <= high, O(log distinct)
+        i = bisect.bisect_left(self.values, low)
+        j = bisect.bisect_right(self.values, high)
+        if i >= j:
+            return 0
+        return self.starts[j] - self.starts[i]
+
+    def equal_range(self, target):
+        # Same answer as equal_range(arr, target), O(log distinct)
+        i = bisect.bisect_left(self.values, target)
+        if i < len(self.values) and self.values[i] == target:
+            return self.starts[i], self.starts[i + 1]
+        return self.starts[i], self.starts[i]
+
+    def __len__(self):
+        return self.starts[-1]
+
+# Example
+arr = [1, 2, 2, 2, 3, 4, 4, 4, 4, 5]
+index = RunLengthIndex(arr)
+print(index.count(4))              # Output: 4
+print(index.count(7))              # Output: 0
+print(index.count_in_range(2, 4))  # Output: 8
+print(index.equal_range(3))        # Output: (4, 5)
+
+
+# Time Complexity (Big-O Notation)
+#   equal_range: O(log n), the common part of the two searches is done once.
+#   RunLengthIndex: build O(n); count O(1); count_in_range and equal_range O(log d), d = number of distinct values.
+# Space Complexity
+#   equal_range: O(1).
+#   RunLengthIndex: O(d) instead of O(n) for the raw array.
@@ -14,3 +14,76 @@ def find_peak(arr):
 # Example
 arr = [1, 2, 3, 4,1]
 print(find_peak(arr))  # Output: 2
+
+
+# 2D peak: an element that is not smaller than its up, down, left and right neighbours.
+# Binary search on the columns: take the largest element of the middle column. If its left or right
+# neighbour is bigger, a peak must exist on that side (keep climbing and you can never come back to
+# this column), so drop the other half. O(n log m) for n rows and m columns.
+def find_peak_2d(grid):
+    rows, cols = len(grid), len(grid[0])
+    left, right = 0, cols - 1
+    while left <= right:
+        mid = left + (right - left) // 2
+        best_row = max(range(rows), key=lambda r: grid[r][mid])
+        value = grid[best_row][mid]
+        left_value = grid[best_row][mid - 1] if mid > 0 else float("-inf")
+        right_value = grid[best_row][mid + 1] if mid < cols - 1 else float("-inf")
+        if value >= left_value and value >= right_value:
+            return best_row, mid
+        elif left_value > value:
+            right = mid - 1
+        else:
+            left = mid + 1
+    return -1, -1
+
+# Example
+grid = [
+    [10, 8, 10, 10],
+    [14, 13, 12, 11],
+    [15, 9, 11, 21],
+    [16, 17, 19, 20],
+]
+print(find_peak_2d(grid))  # Output: (2, 3)
+
+
+# Streaming peaks: the signal arrives in chunks (from a generator, a file or a memory-mapped array) and
+# cannot be held in memory. Only the last two values are remembered between chunks, so a peak that falls
+# on a chunk boundary is still found. Yields (index, value) for every element strictly greater than both
+# neighbours; the first and last element count as peaks when they are greater than their only neighbour,
+# like find_peak.
+def stream_peaks(chunks):
+    index = 0              # global index of the next value
+    prev2 = prev = None    # the two values before it
+    for chunk in chunks:
+        for value in chunk:
+            if prev is not None and prev > value and (prev2 is None or prev > prev2):
+                yield index - 1, prev
+            prev2, prev = prev, value
+            index += 1
+    if prev is not None and (prev2 is None or prev > prev2):
+        yield index - 1, prev
+
+# Example
+def read_in_chunks(signal, size):
+    for i in range(0, len(signal), size):
+        yield signal[i:i + size]
+
+signal = [1, 3, 2, 2, 5, 6, 4, 1, 7]
+print(list(stream_peaks(read_in_chunks(signal, 2))))  # Output: [(1, 3), (5, 6), (8, 7)]
+
+# A memory-mapped file of 8 byte integers can be streamed the same way without loading it:
+#   with open("signal.bin", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+#       data = memoryview(m).cast("q")
+#       for i, value in stream_peaks(read_in_chunks(data, 1 << 20)):
+#           ...
+
+
+# Time Complexity Analysis (Big-O Notation)
+#    - find_peak: O(log n).
+#    - find_peak_2d: O(n log m), one column maximum (n rows) per halving of the m columns.
+#    - stream_peaks: O(n) over the whole stream, O(1) per element.
+
+# Space Complexity
+#    - find_peak / find_peak_2d: O(1).
+#    - stream_peaks: O(1) besides the current chunk.
@@ -0,0 +1,129 @@
+# Problem: Run lower_bound, first_occurrence and last_occurrence on a sorted array that is stored in a binary file
+# too big to load into RAM.
+
+# The file holds fixed-width numbers (for example 8 byte integers 'q' or 8 byte floats 'd') written one after another
+# in sorted order. mmap maps the file into memory without reading it, and memoryview.cast() lets us index it like a
+# list of numbers, so nothing is copied: the operating system only loads the pages that the search touches.
+# A small sparse index (every `step`-th key, kept in a normal list) answers the first probes of every search,
+# so only the last few probes go to the file.
+
+from array import array
+import mmap
+import os
+import tempfile
+
+
+def write_sorted_file(path, values, typecode="q"):
+    # Helper to create a file in the expected format (native byte order).
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+
+
+class MappedSortedArray:
+    def __init__(self, path, typecode="q", step=4096):
+        self.typecode = typecode
+        self.step = step
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        itemsize = array(typecode).itemsize
+        if size % itemsize:
+            self._file.close()
+            raise ValueError(f"file size {size} is not a multiple of the item size {itemsize}")
+
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data = memoryview(self._map).cast(typecode)
+        else:  # mmap cannot map an empty file
+            self._map = None
+            self.data = memoryview(array(typecode))
+
+        # Sparse index: sample[i] == data[i * step]
+        self.sample = [self.data[i] for i in range(0, len(self.data), step)]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        return self.data[i]
+
+    def _bound(self, target, strict):
+        # strict=True gives lower_bound (first key >= target), strict=False gives upper_bound (first key > target).
+        sample, step = self.sample, self.step
+
+        # 1. Search the in-memory sample to find the block that holds the answer.
+        left, right = 0, len(sample)
+        while left < right:
+            mid = left + (right - left) // 2
+            if sample[mid] < target or (not strict and sample[mid] == target):
+                left = mid + 1
+            else:
+                right = mid
+        # The answer is after sample[left - 1] and not after sample[left].
+        lo = max(left - 1, 0) * step
+        hi = min(left * step, len(self.data))
+
+        # 2. Finish inside that block of the file.
+        data = self.data
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            if data[mid] < target or (not strict and data[mid] == target):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lower_bound(self, target):
+        return self._bound(target, True)
+
+    def upper_bound(self, target):
+        return self._bound(target, False)
+
+    def first_occurrence(self, target):
+        i = self.lower_bound(target)
+        if i < len(self.data) and self.data[i] == target:
+            return i
+        return -1
+
+    def last_occurrence(self, target):
+        i = self.upper_bound(target) - 1
+        if i >= 0 and self.data[i] == target:
+            return i
+        return -1
+
+    def close(self):
+        self.data.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Example
+path = os.path.join(tempfile.mkdtemp(), "keys.bin")
+write_sorted_file(path, [1, 2, 2, 2, 3, 4, 5, 7, 9, 11], "q")
+
+with MappedSortedArray(path, "q", step=4) as keys:
+    print(len(keys))                   # Output: 10
+    print(keys.lower_bound(6))         # Output: 7
+    print(keys.first_occurrence(2))    # Output: 1
+    print(keys.last_occurrence(2))     # Output: 3
+    print(keys.first_occurrence(8))    # Output: -1
+
+write_sorted_file(path, [0.5, 1.25, 1.25, 3.0], "d")
+with MappedSortedArray(path, "d") as keys:
+    print(keys.last_occurrence(1.25))  # Output: 2
+
+os.remove(path)
+
+
+# Time Complexity Analysis (Big-O Notation)
+#    - Opening: O(n / step) to read the sparse sample, the rest of the file is not read.
+#    - Each query: O(log(n / step)) in memory + O(log step) probes into the file, O(log n) overall.
+#    - With step = 4096 and 8 byte keys a block is 32 KB, so a query touches at most ~8 pages of the file.
+
+# Space Complexity
+#    - O(n / step) for the sparse sample; the file itself is mapped, not copied.
@@ -0,0 +1,115 @@
+# Problem: A rotated sorted array is queried many times (search, min, max, k-th smallest) and is rotated again from
+# time to time. Find the rotation point once and answer every query with a plain binary search.
+
+# search_rotated works out which half is sorted on every probe, and find_min looks for the rotation point again on
+# every call. If we know the index of the smallest element (the pivot), the k-th smallest element is simply at
+# (pivot + k) % n, so the array can be searched like a normal sorted array through that offset.
+# Rotating the array again only moves where the array starts, so the index keeps the stored elements where they are
+# and just moves a start offset: O(1) per rotation instead of rebuilding. This fits ring buffers well.
+# Like search_rotated and find_min, the elements are assumed to be distinct.
+
+
+def find_pivot(arr):
+    # Same search as find_min, but returns the index of the minimum instead of its value
+    left, right = 0, len(arr) - 1
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] > arr[right]:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+class RotatedArrayIndex:
+    def __init__(self, arr):
+        self.arr = arr                  # stored elements, never moved
+        self.n = len(arr)
+        self.pivot = find_pivot(arr)    # stored index of the smallest element
+        self.start = 0                  # stored index of the element at position 0 of the current rotation
+
+    def rotate_right(self, k):
+        # Same as arr = arr[-k:] + arr[:-k], in O(1)
+        if self.n:
+            self.start = (self.start - k) % self.n
+
+    def rotate_left(self, k):
+        self.rotate_right(-k)
+
+    def _sorted(self, r):
+        # r-th smallest element (0 based)
+        return self.arr[(self.pivot + r) % self.n]
+
+    def search(self, target):
+        # Index of target in the current rotation, or -1
+        left, right = 0, self.n - 1
+        while left <= right:
+            mid = left + (right - left) // 2
+            value = self._sorted(mid)
+            if value == target:
+                return (self.pivot + mid - self.start) % self.n
+            elif value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return -1
+
+    def _check_not_empty(self):
+        if not self.n:
+            raise ValueError("the array is empty")
+
+    def find_min(self):
+        self._check_not_empty()
+        return self.arr[self.pivot]
+
+    def find_max(self):
+        self._check_not_empty()
+        return self._sorted(self.n - 1)
+
+    def kth_smallest(self, k):
+        # k is 1 based, like kth_smallest in K-thSmallLarge.py
+        if not 1 <= k <= self.n:
+            raise IndexError("k out of range")
+        return self._sorted(k - 1)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        # Element at index i of the current rotation (negative i counts from the end, like a list)
+        if not -self.n <= i < self.n:
+            raise IndexError("index out of range")
+        return self.arr[(self.start + i) % self.n]
+
+    def __iter__(self):
+        # Current rotation, index by index, without copying the array
+        for i in range(self.start, self.start + self.n):
+            yield self.arr[i % self.n]
+
+    def __contains__(self, target):
+        return self.search(target) != -1  # O(log n) instead of a scan
+
+    def to_list(self):
+        return list(self)
+
+# Example
+index = RotatedArrayIndex([4, 5, 6, 7, 0, 1, 2])
+print(index.search(7))        # Output: 3
+print(index.find_min())       # Output: 0
+print(index.find_max())       # Output: 7
+print(index.kth_smallest(3))  # Output: 2
+
+index.rotate_right(2)
+print(index.to_list())        # Output: [1, 2, 4, 5, 6, 7, 0]
+print(index.search(7))        # Output: 5
+print(index.search(3))        # Output: -1
+print(99 in index, 7 in index, index[-1])  # Output: False True 0
+
+
+# Time Complexity Analysis (Big-O Notation)
+#    - Build: O(log n) to find the pivot.
+#    - search: O(log n), a normal binary search with no "which half is sorted" checks.
+#    - find_min / find_max / kth_smallest / rotate_right / rotate_left / indexing: O(1).   `in`: O(log n) through search.
+
+# Space Complexity
+#    - O(1) besides the array itself, which is not copied.
@@ -13,3 +13,98 @@ def find_missing(arr):
 # Example
 arr = [1, 2, 3, 5, 6]
 print(find_missing(arr))  # Output: 4
+
+
+# Dynamic version: ids are added and removed all the time (an id pool), the array is not sorted and may
+# contain duplicates. Keep a presence flag per id plus a Fenwick tree (binary indexed tree) of the flags.
+# tree[i] holds how many ids are present in a block of the ids ending at i. The smallest missing id is found by
+# walking down the tree and skipping every block that is completely full: O(log n), the same
+# "halve the range" idea as find_missing, but on a structure that can change.
+class MissingPositiveSet:
+    def __init__(self, capacity=1024):
+        self.size = 1
+        while self.size < capacity:
+            self.size *= 2
+        self.present = bytearray(self.size + 1)   # present[i] == 1 when id i is in the set (index 0 unused)
+        self.tree = [0] * (self.size + 1)
+
+    @classmethod
+    def from_iterable(cls, ids):
+        # Bulk load from an unsorted array in one pass, then build the tree in O(n) instead of n inserts.
+        ids = list(ids)
+        largest = max((i for i in ids if i > 0), default=0)
+        pool = cls(max(largest, 1))
+        for i in ids:
+            if i > 0:
+                pool.present[i] = 1
+        pool._rebuild()
+        return pool
+
+    def _rebuild(self):
+        tree = [0] * (self.size + 1)
+        for i in range(1, self.size + 1):
+            tree[i] += self.present[i]
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _grow(self, id_):
+        while self.size < id_:
+            self.size *= 2
+        self.present.extend(bytes(self.size + 1 - len(self.present)))
+        self._rebuild()
+
+    def _update(self, i, delta):
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def add(self, id_):
+        if id_ <= 0:
+            raise ValueError("ids must be positive")
+        if id_ > self.size:
+            self._grow(id_)
+        if not self.present[id_]:
+            self.present[id_] = 1
+            self._update(id_, 1)
+
+    def remove(self, id_):
+        if 0 < id_ <= self.size and self.present[id_]:
+            self.present[id_] = 0
+            self._update(id_, -1)
+
+    def __contains__(self, id_):
+        return 0 < id_ <= self.size and self.present[id_] == 1
+
+    def smallest_missing(self):
+        pos = 0
+        step = self.size
+        while step:
+            if pos + step <= self.size and self.tree[pos + step] == step:  # ids pos+1 .. pos+step are all present
+                pos += step
+            step //= 2
+        return pos + 1
+
+    def allocate(self):
+        # Take the smallest free id from the pool
+        id_ = self.smallest_missing()
+        self.add(id_)
+        return id_
+
+# Example
+pool = MissingPositiveSet.from_iterable([5, 3, 1, 2, 6, 3])
+print(pool.smallest_missing())  # Output: 4
+pool.add(4)
+print(pool.smallest_missing())  # Output: 7
+pool.remove(2)
+print(pool.allocate())          # Output: 2
+print(pool.allocate())          # Output: 7
+
+
+# Time Complexity Analysis (Big-O Notation)
+#    - find_missing: O(log n), sorted arrays of unique numbers only.
+#    - MissingPositiveSet: add / remove / smallest_missing O(log n), bulk load O(n), growing O(n) (doubles the size).
+
+# Space Complexity
+#    - MissingPositiveSet: one byte per id for the flags plus the tree, O(largest id).
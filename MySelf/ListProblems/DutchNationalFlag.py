@@ -1,5 +1,13 @@
 # Solution Using Dutch National Flag Algorithm
 
+from array import array as typed_array  # `array` is used as a variable name below
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
 def sort_012(arr):
     low = 0       # Pointer for 0s
     mid = 0       # Pointer for 1s
@@ -24,3 +32,89 @@ def sort_012(arr):
 array = [1,0,1, 2, 1, 0, 2, 1,2,1,2,1, 0]
 sorted_array = sort_012(array)
 print("Sorted Array:", sorted_array)
+
+
+
+# Same idea for any small set of values (labels 0..255, letters, ...): count how many times each value
+# appears, then write every value as one block. Counting is one pass done in C by Counter (or numpy.bincount),
+# and each block is written with one slice assignment, so no element is swapped one by one.
+# `order` gives the order of the blocks (like putting 0s, 1s, 2s in any order you want); by default the values are sorted.
+# Works in place on lists, bytearray, array.array and NumPy arrays.
+def sort_small_alphabet(arr, order=None):
+    if np is not None and isinstance(arr, np.ndarray) and order is None and arr.dtype.kind in "ui":
+        # Vectorized: histogram + repeat, both in C
+        low = int(arr.min()) if arr.size else 0
+        # Subtract in a wide type: in the array's own dtype, 127 - (-128) wraps around to -1 for int8
+        if arr.dtype.kind == "u":
+            offsets = (arr - arr.dtype.type(low)).astype(np.intp)  # every value >= low, cannot wrap
+        else:
+            offsets = arr.astype(np.intp) - low
+        counts = np.bincount(offsets)
+        arr[:] = np.repeat(np.arange(low, low + len(counts), dtype=arr.dtype), counts)
+        return arr
+
+    counts = Counter(arr)
+    if order is None:
+        order = sorted(counts)
+    elif set(counts) - set(order):
+        raise ValueError(f"values missing from order: {sorted(set(counts) - set(order))}")
+
+    if isinstance(arr, typed_array):
+        block = lambda value, count: typed_array(arr.typecode, [value]) * count
+    elif isinstance(arr, (bytearray, memoryview)):
+        block = lambda value, count: bytes([value]) * count
+    elif np is not None and isinstance(arr, np.ndarray):
+        block = lambda value, count: value
+    else:
+        block = lambda value, count: [value] * count
+
+    start = 0
+    for value in order:
+        count = counts.get(value, 0)
+        if count:
+            arr[start:start + count] = block(value, count)
+            start += count
+    return arr
+
+# Example
+labels = typed_array("B", [3, 1, 0, 3, 2, 1, 0, 255, 3])
+print(sort_small_alphabet(labels).tolist())               # Output: [0, 0, 1, 1, 2, 3, 3, 3, 255]
+print(sort_small_alphabet([1, 0, 2, 1, 0], order=[2, 0, 1]))  # Output: [2, 0, 0, 1, 1]
+
+
+# Stable version for records sorted by a small label: records with the same label keep their original order.
+# Count the labels, turn the counts into start positions, then copy every record straight to its place.
+def stable_sort_small_alphabet(records, key, order=None):
+    labels = [key(r) for r in records]
+    counts = Counter(labels)
+    if order is None:
+        order = sorted(counts)
+    start = {}
+    total = 0
+    for value in order:
+        start[value] = total
+        total += counts.get(value, 0)
+    if total != len(records):
+        raise ValueError("some labels are missing from order")
+
+    result = [None] * len(records)
+    for record, label in zip(records, labels):
+        result[start[label]] = record
+        start[label] += 1
+    return result
+
+# Example
+people = [("ann", 2), ("bob", 0), ("cid", 2), ("dan", 1), ("eve", 0)]
+print(stable_sort_small_alphabet(people, key=lambda p: p[1]))
+# Output: [('bob', 0), ('eve', 0), ('dan', 1), ('ann', 2), ('cid', 2)]
+
+# For NumPy label arrays the stable order is numpy.argsort(labels, kind="stable"), a radix sort for small integer types.
+
+
+# Time Complexity
+#   sort_012: O(n), one pass, one Python step per element.
+#   sort_small_alphabet: O(n + k log k) for k distinct values; the O(n) part (counting and writing blocks) runs in C.
+#   stable_sort_small_alphabet: O(n + k log k).
+# Space Complexity
+#   sort_small_alphabet: O(k) for the counts, the array is sorted in place.
+#   stable_sort_small_alphabet: O(n) for the output list.
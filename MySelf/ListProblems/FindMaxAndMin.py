@@ -1,5 +1,15 @@
 # Here’s a Python solution to find the maximum and minimum elements in an array:
 
+import mmap
+import os
+from array import array as typed_array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
 def find_max_and_min(arr):
     
     if not arr:  # Check if the array is empty
@@ -23,3 +33,128 @@ array = [3, 1, 5, 7, 2, 8, 4]
 maximum, minimum = find_max_and_min(array)
 print("Maximum:", maximum)
 print("Minimum:", minimum)
+
+
+# Pairwise version: take the elements two at a time, compare them with each other first, then compare only
+# the bigger one with the maximum and the smaller one with the minimum: 3 comparisons per 2 elements
+# instead of 4. With with_index=True it also returns the index of the (first) maximum and minimum.
+def find_max_and_min_pairwise(arr, with_index=False):
+    n = len(arr)
+    if n == 0:
+        return (None, None, None, None) if with_index else (None, None)
+
+    if n % 2:
+        max_i = min_i = 0
+        start = 1
+    else:
+        if arr[1] > arr[0]:
+            max_i, min_i = 1, 0
+        elif arr[1] < arr[0]:
+            max_i, min_i = 0, 1
+        else:
+            max_i = min_i = 0
+        start = 2
+    max_element, min_element = arr[max_i], arr[min_i]
+
+    for i in range(start, n - 1, 2):
+        a, b = arr[i], arr[i + 1]
+        if b > a:
+            big, big_i, small, small_i = b, i + 1, a, i
+        elif b < a:
+            big, big_i, small, small_i = a, i, b, i + 1
+        else:
+            big, big_i, small, small_i = a, i, a, i
+        if big > max_element:
+            max_element, max_i = big, big_i
+        if small < min_element:
+            min_element, min_i = small, small_i
+
+    if with_index:
+        return max_element, min_element, max_i, min_i
+    return max_element, min_element
+
+# Example
+print(find_max_and_min_pairwise([3, 1, 5, 7, 2, 8, 4]))                   # Output: (8, 1)
+print(find_max_and_min_pairwise([3, 1, 5, 7, 2, 8, 4], with_index=True))  # Output: (8, 1, 5, 1)
+
+
+# Typed arrays: array.array and NumPy arrays can be scanned in C instead of a Python loop.
+def find_max_and_min_fast(arr, with_index=False):
+    if len(arr) == 0:
+        return (None, None, None, None) if with_index else (None, None)
+    if np is not None and isinstance(arr, np.ndarray):
+        max_i, min_i = int(arr.argmax()), int(arr.argmin())
+        max_element, min_element = arr[max_i].item(), arr[min_i].item()
+    elif isinstance(arr, (typed_array, bytes, bytearray, memoryview, list, tuple)):
+        max_element, min_element = max(arr), min(arr)
+        if with_index:
+            max_i, min_i = _index(arr, max_element), _index(arr, min_element)
+    else:
+        return find_max_and_min_pairwise(arr, with_index)
+    if with_index:
+        return max_element, min_element, max_i, min_i
+    return max_element, min_element
+
+
+def _index(arr, value):
+    if isinstance(arr, memoryview):
+        return arr.tolist().index(value)
+    return arr.index(value)
+
+# Example
+print(find_max_and_min_fast(typed_array("d", [3, 1, 5, 7, 2, 8, 4]), with_index=True))  # Output: (8.0, 1.0, 5, 1)
+
+
+# Files of several GB: split a binary file of fixed-width numbers into chunks, let every process map its own
+# chunk with mmap and scan it in C, then combine the per-chunk answers (the earliest index wins on ties).
+def _chunk_max_and_min(path, typecode, start, stop):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        view = memoryview(m).cast(typecode)
+        try:
+            chunk = view[start:stop]
+            # One chunk is small enough to copy into a typed array, which also gives C-speed index()
+            values = typed_array(typecode, chunk.tobytes())
+            chunk.release()
+        finally:
+            view.release()
+    max_element, min_element = max(values), min(values)
+    return max_element, min_element, start + values.index(max_element), start + values.index(min_element)
+
+
+def find_max_and_min_file(path, typecode="q", with_index=False, workers=None, chunk_items=1 << 24):
+    itemsize = typed_array(typecode).itemsize
+    n = os.path.getsize(path) // itemsize
+    if n == 0:
+        return (None, None, None, None) if with_index else (None, None)
+
+    starts = list(range(0, n, chunk_items))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_chunk_max_and_min, [path] * len(starts), [typecode] * len(starts),
+                              starts, [min(s + chunk_items, n) for s in starts]))
+
+    max_element, min_element, max_i, min_i = parts[0]
+    for part_max, part_min, part_max_i, part_min_i in parts[1:]:
+        if part_max > max_element:
+            max_element, max_i = part_max, part_max_i
+        if part_min < min_element:
+            min_element, min_i = part_min, part_min_i
+    if with_index:
+        return max_element, min_element, max_i, min_i
+    return max_element, min_element
+
+
+if __name__ == "__main__":  # worker processes import this file, so run the example only once
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "values.bin")
+    with open(path, "wb") as f:
+        typed_array("q", [3, 1, 5, 7, 2, 8, 4]).tofile(f)
+    print(find_max_and_min_file(path, "q", with_index=True, workers=2, chunk_items=3))  # Output: (8, 1, 5, 1)
+    os.remove(path)
+
+
+# Time Complexity
+#   find_max_and_min: O(n), 2 comparisons per element.
+#   find_max_and_min_pairwise: O(n), 1.5 comparisons per element.
+#   find_max_and_min_fast / find_max_and_min_file: O(n), the scans run in C (and in parallel for files).
+# Space Complexity
+#   O(1), except find_max_and_min_file which copies one chunk per worker.
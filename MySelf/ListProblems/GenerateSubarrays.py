@@ -9,3 +9,55 @@ def generate_subarrays(arr):
 arr = ['p', 'w', 'w', 'k', 'e', 'w']
 result = generate_subarrays(arr)
 print(result)
+
+
+
+# Lazy version: generate_subarrays keeps every slice in memory at once (O(n^3) elements in total).
+# Here the pieces are produced one at a time, in the same order, and only as (start, end) indexes
+# (end is exclusive), so the caller can filter by length or any predicate before anything is copied.
+def iter_subarrays_indexes(n, min_len=1, max_len=None, predicate=None):
+    min_len = max(min_len, 1)  # a subarray is never empty
+    if max_len is None or max_len > n:
+        max_len = n
+    for i in range(n):
+        for j in range(i + min_len, min(i + max_len, n) + 1):
+            if predicate is None or predicate(i, j):
+                yield i, j
+
+
+# Views instead of copies: for bytes, bytearray, array.array and NumPy arrays a memoryview slice
+# points into the original buffer. For other sequences (lists) the slice is copied, but only
+# for the pieces that passed the filters, and only one at a time.
+def iter_subarrays(arr, min_len=1, max_len=None, predicate=None):
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        view = arr
+    for i, j in iter_subarrays_indexes(len(arr), min_len, max_len, predicate):
+        yield view[i:j]
+
+# Example
+arr = ['p', 'w', 'w', 'k', 'e', 'w']
+print([arr[i:j] for i, j in iter_subarrays_indexes(len(arr), min_len=5)])
+# Output: [['p', 'w', 'w', 'k', 'e'], ['p', 'w', 'w', 'k', 'e', 'w'], ['w', 'w', 'k', 'e', 'w']]
+print([bytes(v) for v in iter_subarrays(b"abc", max_len=2)])  # Output: [b'a', b'ab', b'b', b'bc', b'c']
+
+
+# Count only: for n elements there are n - L + 1 pieces of length L, n(n+1)/2 in total.
+# With a predicate every (start, end) pair is checked, but still nothing is copied.
+def count_subarrays(n, min_len=1, max_len=None, predicate=None):
+    min_len = max(min_len, 1)  # same pieces as iter_subarrays_indexes
+    if max_len is None or max_len > n:
+        max_len = n
+    if predicate is not None:
+        return sum(1 for _ in iter_subarrays_indexes(n, min_len, max_len, predicate))
+    if min_len > max_len:
+        return 0
+    # sum of (n - L + 1) for L = min_len .. max_len
+    terms = max_len - min_len + 1
+    return terms * (n + 1) - (min_len + max_len) * terms // 2
+
+# Example
+print(count_subarrays(6))                                    # Output: 21
+print(count_subarrays(6, min_len=2, max_len=3))              # Output: 9
+print(count_subarrays(len(arr), predicate=lambda i, j: arr[i] == arr[j - 1]))  # Output: 9
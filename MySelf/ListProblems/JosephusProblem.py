@@ -1,13 +1,14 @@
-def josephus_problem(lst, step):
+def josephus_problem(lst, step, on_remove=None):
     index = 0  # Starting index
     while len(lst) > 1:
         index = (index + step - 1) % len(lst)  # Circular index calculation
-        print(f"Removing: {lst[index]}")
+        if on_remove is not None:
+            on_remove(lst[index])
         lst.pop(index)  # Remove element at index
     return lst[0]  # Return the last remaining element
 
 list1 = ["A", "B", "C", "D", "E", "F", "G"]
-final_value = josephus_problem(list1, 3)
+final_value = josephus_problem(list1, 3, on_remove=lambda x: print(f"Removing: {x}"))
 
 print("Final remaining element:", final_value)
 
@@ -25,3 +26,84 @@ while len(list1) > 1:
 
 
 print("Final remaining element:", list1)
+
+
+
+# Faster elimination order: list.pop(index) moves every element after index, so the loop above is O(n^2).
+# Instead keep everyone in place and use a Fenwick tree (binary indexed tree) that counts who is still in the
+# circle. "Who is the k-th person still in?" is answered by walking down the tree in O(log n), and removing
+# someone is one tree update. Yields the removed elements in order and finally the survivor.
+def josephus_order(lst, step, on_remove=None):
+    n = len(lst)
+    size = 1
+    while size < n:
+        size *= 2
+    tree = [0] * (size + 1)
+    for i in range(1, size + 1):  # every position starts with count 1, built in O(n)
+        tree[i] += i <= n
+        parent = i + (i & -i)
+        if parent <= size:
+            tree[parent] += tree[i]
+
+    index = 0  # same circular index as josephus_problem, counted among the remaining people
+    for remaining in range(n, 0, -1):
+        index = (index + step - 1) % remaining
+        # find the position of the (index + 1)-th person still in the circle
+        pos, k, bit = 0, index + 1, size
+        while bit:
+            if pos + bit <= size and tree[pos + bit] < k:
+                pos += bit
+                k -= tree[pos]
+            bit //= 2
+        i = pos + 1  # 1 based position in lst
+        while i <= size:
+            tree[i] -= 1
+            i += i & -i
+        if remaining > 1 and on_remove is not None:
+            on_remove(lst[pos])
+        yield lst[pos]
+
+# Example
+print(list(josephus_order(["A", "B", "C", "D", "E", "F", "G"], 3)))  # Output: ['C', 'F', 'B', 'G', 'E', 'A', 'D']
+
+
+# Survivor only: with people numbered 0..n-1, the survivor of a circle of i people is
+# J(i) = (J(i - 1) + step) % i, with J(1) = 0. O(n) time, O(1) memory, no list needed.
+def josephus_survivor(n, step):
+    survivor = 0
+    for i in range(2, n + 1):
+        survivor = (survivor + step) % i
+    return survivor
+
+
+# For small steps and huge n: one trip around the circle removes n // step people at once,
+# so the circle shrinks by a factor (1 - 1/step) per round: O(step * log n) rounds.
+def josephus_survivor_small_step(n, step):
+    if step == 1:
+        return n - 1
+    sizes = []
+    while n > 1 and n >= step:
+        sizes.append(n)
+        n -= n // step
+    survivor = josephus_survivor(n, step)  # n < step here, the plain recurrence is cheap
+    for size in reversed(sizes):
+        # map the survivor of the smaller circle back to the circle of `size` people
+        survivor -= size % step
+        if survivor < 0:
+            survivor += size
+        else:
+            survivor += survivor // (step - 1)
+    return survivor
+
+# Example
+people = ["A", "B", "C", "D", "E", "F", "G"]
+print(people[josephus_survivor(len(people), 3)])              # Output: D
+print(josephus_survivor_small_step(10 ** 12, 3))              # Output: 706915036708
+
+
+# Time Complexity
+#   josephus_problem: O(n^2) because of list.pop(index).
+#   josephus_order: O(n log n), each removal is one tree walk and one tree update.
+#   josephus_survivor: O(n).   josephus_survivor_small_step: O(step * log n).
+# Space Complexity
+#   josephus_order: O(n) for the tree.   josephus_survivor / josephus_survivor_small_step: O(1) / O(step * log n).
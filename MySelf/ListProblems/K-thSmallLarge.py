@@ -58,21 +58,145 @@
 # k = 3
 # print("K-th Largest Element:", kth_largest(array, k))
 
+import heapq
+import random
+
 array =  [7, 10, 4, 3,10, 20, 15]
 def dublicationRemove(arr,k,l):
-    for i in range(len(arr)):
-        for j in range(i + 1, len(arr)):  # Fix to avoid redundant swaps
-            if arr[i] > arr[j]:  # Correct the comparison
-                # Swap elements
-                arr[i], arr[j] = arr[j], arr[i]
+    arr.sort()  # O(n log n) instead of the O(n^2) swap loop
     newArr = []
     for i in arr:
-        if i not in newArr:
-            if l == "S":
-                newArr =[i]+newArr
-            elif l == "L":
-                newArr += [i]
+        if not newArr or newArr[-1] != i:  # arr is sorted, so a repeat can only follow its own copy
+            newArr.append(i)
+    if l == "S":
+        newArr.reverse()  # same order as prepending every value
+    elif l != "L":
+        newArr = []
     return newArr,newArr[k-1]
     
 print(dublicationRemove(array,2,"S"))
-print(dublicationRemove(array,2,"L"))
\ No newline at end of file
+print(dublicationRemove(array,2,"L"))
+
+
+# Selection without sorting.
+# Quickselect: split around a pivot into smaller / equal / bigger and keep only the part that holds the k-th
+# element, O(n) on average. A run of bad pivots could make it O(n^2), so the random rounds get a work budget of
+# 4n element comparisons; once it is spent, the pivot is chosen with median of medians, which always leaves at
+# most ~70% of the elements. Random rounds cost at most 4n and the fallback O(n) more: O(n) in the worst case
+# (this switch is what "introselect" means).
+def median_of_medians(arr):
+    if len(arr) <= 5:
+        return sorted(arr)[len(arr) // 2]
+    medians = [sorted(arr[i:i + 5])[len(arr[i:i + 5]) // 2] for i in range(0, len(arr), 5)]
+    return select(medians, len(medians) // 2)
+
+
+def select(arr, index):
+    # index is 0 based: select(arr, 0) is the minimum. arr is not modified.
+    if not 0 <= index < len(arr):
+        raise IndexError("k out of range")
+    budget = 4 * len(arr)
+    while True:
+        if len(arr) <= 16:
+            return sorted(arr)[index]
+        if budget > 0:
+            pivot = random.choice(arr)
+            budget -= len(arr)
+        else:
+            pivot = median_of_medians(arr)
+        smaller = [x for x in arr if x < pivot]
+        bigger = [x for x in arr if x > pivot]
+        equal = len(arr) - len(smaller) - len(bigger)
+        if index < len(smaller):
+            arr = smaller
+        elif index < len(smaller) + equal:
+            return pivot
+        else:
+            index -= len(smaller) + equal
+            arr = bigger
+
+
+def kth_smallest(arr, k):
+    return select(arr, k - 1)
+
+
+def kth_largest(arr, k):
+    return select(arr, len(arr) - k)
+
+# Example
+array = [7, 10, 4, 3, 20, 15]
+print("K-th Smallest Element:", kth_smallest(array, 3))  # Output: 7
+print("K-th Largest Element:", kth_largest(array, 3))    # Output: 10
+
+
+# k-th smallest / largest among the distinct values: drop the copies with a set (O(n)), then select.
+def kth_smallest_distinct(arr, k):
+    return select(list(set(arr)), k - 1)
+
+
+def kth_largest_distinct(arr, k):
+    distinct = list(set(arr))
+    return select(distinct, len(distinct) - k)
+
+# Example
+array = [7, 10, 4, 3, 10, 20, 15]
+print(kth_smallest_distinct(array, 2), kth_largest_distinct(array, 2))  # Output: 4 15
+
+
+# Many k at once: one split around the pivot serves every k; each side then continues with only its own ks.
+def select_many(arr, ks):
+    # ks are 1 based; returns {k: k-th smallest}
+    for k in ks:
+        if not 1 <= k <= len(arr):
+            raise IndexError("k out of range")
+    result = {}
+    todo = [(arr, 0, sorted(set(ks)))]  # (part, number of elements before it, ks that fall in it)
+    while todo:
+        part, offset, wanted = todo.pop()
+        if len(part) <= 16 or len(wanted) == 1:
+            if len(part) <= 16:
+                ordered = sorted(part)
+                for k in wanted:
+                    result[k] = ordered[k - offset - 1]
+            else:
+                result[wanted[0]] = select(part, wanted[0] - offset - 1)
+            continue
+        pivot = random.choice(part)
+        smaller = [x for x in part if x < pivot]
+        bigger = [x for x in part if x > pivot]
+        equal_end = offset + len(part) - len(bigger)
+        left = [k for k in wanted if k <= offset + len(smaller)]
+        right = [k for k in wanted if k > equal_end]
+        for k in wanted:
+            if offset + len(smaller) < k <= equal_end:
+                result[k] = pivot
+        if left:
+            todo.append((smaller, offset, left))
+        if right:
+            todo.append((bigger, equal_end, right))
+    return {k: result[k] for k in ks}
+
+# Example
+print(select_many([7, 10, 4, 3, 20, 15], [1, 3, 6]))  # Output: {1: 3, 3: 7, 6: 20}
+
+
+# Top k of an unbounded stream: heapq.nlargest / nsmallest keep a heap of the k best items seen so far.
+# O(n log k) time, O(k) memory, and they only compare items, so strings and other non-numbers work too.
+def stream_top_k(items, k, largest=True):
+    # k <= 0 gives []
+    return heapq.nlargest(k, items) if largest else heapq.nsmallest(k, items)
+
+# Example
+print(stream_top_k(iter([7, 10, 4, 3, 20, 15]), 3))                 # Output: [20, 15, 10]
+print(stream_top_k(iter([7, 10, 4, 3, 20, 15]), 2, largest=False))  # Output: [3, 4]
+print(stream_top_k(iter(["pear", "apple", "fig", "kiwi"]), 2, largest=False))  # Output: ['apple', 'fig']
+
+
+# Time Complexity
+#   dublicationRemove: O(n log n).
+#   kth_smallest / kth_largest: O(n) on average and in the worst case (median of medians fallback).
+#   kth_smallest_distinct / kth_largest_distinct: O(n).
+#   select_many: O(n log m) on average for m different ks.
+#   stream_top_k: O(n log k).
+# Space Complexity
+#   select / select_many: O(n) for the parts (the input is not modified). stream_top_k: O(k).
\ No newline at end of file
@@ -1,5 +1,7 @@
 # Python implementation
 
+import operator
+
 arr = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
 roman_map = {
     1: "I",
@@ -31,3 +33,64 @@ def int_to_roman(num):
 # Example usage
 num = 555
 print(int_to_roman(num))
+
+
+# Table version: every decimal digit maps to a fixed piece of the numeral, so four lookups and one join
+# build the whole numeral (no inner loops, no repeated string +=).
+THOUSANDS = ["", "M", "MM", "MMM"]
+HUNDREDS = ["", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM"]
+TENS = ["", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC"]
+UNITS = ["", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX"]
+
+
+def int_to_roman_table(num):
+    return THOUSANDS[num // 1000] + HUNDREDS[num // 100 % 10] + TENS[num // 10 % 10] + UNITS[num % 10]
+
+# Example
+print(int_to_roman_table(1994))  # Output: MCMXCIV
+
+
+# Optional cache of every numeral from 1 to 3999 (about 90 KB of strings): encoding is then one list lookup.
+ROMAN_CACHE = None
+
+
+def build_roman_cache():
+    global ROMAN_CACHE
+    if ROMAN_CACHE is None:
+        ROMAN_CACHE = [""] + [int_to_roman_table(n) for n in range(1, 4000)]
+    return ROMAN_CACHE
+
+
+# Encode a whole column of numbers. Returns a list of numerals, or one newline-joined string with join=True.
+# Roman numerals only go from 1 to 3999, so every value is checked first. Any integer type is accepted
+# (NumPy integers included, through operator.index); bool is rejected, True is not the number 1 here.
+def int_to_roman_batch(values, join=False, use_cache=True):
+    checked = []
+    for i, num in enumerate(values):
+        if isinstance(num, bool):
+            raise TypeError(f"value {num!r} at position {i} is not an integer")
+        try:
+            number = operator.index(num)
+        except TypeError:
+            raise TypeError(f"value {num!r} at position {i} is not an integer") from None
+        if not 1 <= number <= 3999:
+            raise ValueError(f"value {num!r} at position {i} is outside 1..3999")
+        checked.append(number)
+    values = checked
+    if use_cache:
+        cache = build_roman_cache()
+        result = [cache[num] for num in values]
+    else:
+        result = [int_to_roman_table(num) for num in values]
+    return "\n".join(result) if join else result
+
+# Example
+print(int_to_roman_batch([1987, 2024, 4, 555]))      # Output: ['MCMLXXXVII', 'MMXXIV', 'IV', 'DLV']
+print(repr(int_to_roman_batch(range(1, 4), join=True)))  # Output: 'I\nII\nIII'
+
+
+# Time Complexity
+#   int_to_roman: O(number of symbols). int_to_roman_table: four lookups, O(1).
+#   int_to_roman_batch: O(n), one list lookup per value with the cache.
+# Space Complexity
+#   Cache: 3999 short strings, built once.
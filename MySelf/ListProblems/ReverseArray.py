@@ -1,5 +1,15 @@
 # Reverse the array
 
+import mmap
+import os
+import tempfile
+from array import array as typed_array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
 def reverse_array_recursive(arr, left, right):
     if left >= right:
         return
@@ -24,3 +34,89 @@ for i in range(len(list1)):
         list1[i],list1[-(i+1)] = list1[-(i+1)],list1[i]
 print(list1)
         
+
+
+# Iterative, in-place reversal of arr[start:stop] for any mutable sequence or writable buffer.
+# The recursive version uses one call per swapped pair and hits the recursion limit at ~2000 elements.
+#   - list / array.array / bytearray / NumPy array: one slice assignment of the reversed slice, done in C.
+#   - mmap and other huge buffers: swap blocks from both ends (each block reversed in memory), so only
+#     2 * block bytes are ever held outside the buffer, whatever its size.
+# itemsize is the size of one record in bytes when reversing raw buffers (mmap, bytearray of records).
+# It defaults to the view's own item size for a memoryview (8 for a 'q' view) and to 1 byte otherwise.
+def reverse_in_place(arr, start=0, stop=None, itemsize=None, block=1 << 20):
+    if itemsize is None:
+        itemsize = arr.itemsize if isinstance(arr, memoryview) else 1
+    if isinstance(arr, (mmap.mmap, memoryview)):
+        return _reverse_buffer(arr, start, stop, itemsize, block)
+    if itemsize != 1:
+        return _reverse_buffer(arr, start, stop, itemsize, block)
+    n = len(arr)
+    if stop is None:
+        stop = n
+    if not 0 <= start <= stop <= n:
+        raise IndexError("range out of bounds")
+    if np is not None and isinstance(arr, np.ndarray):
+        arr[start:stop] = arr[start:stop][::-1].copy()
+    else:
+        arr[start:stop] = arr[start:stop][::-1]
+    return arr
+
+
+def _reverse_buffer(buf, start, stop, itemsize, block):
+    # start / stop count records of `itemsize` bytes
+    view = memoryview(buf).cast("B")
+    n = len(view) // itemsize
+    if stop is None:
+        stop = n
+    if not 0 <= start <= stop <= n:
+        raise IndexError("range out of bounds")
+    if view.readonly:
+        raise TypeError("buffer is read-only")
+
+    per_block = max(1, block // itemsize)  # records per block
+    left, right = start, stop
+    while right - left > 1:
+        count = min(per_block, (right - left) // 2)
+        a = _reversed_records(view[left * itemsize:(left + count) * itemsize], itemsize)
+        b = _reversed_records(view[(right - count) * itemsize:right * itemsize], itemsize)
+        view[left * itemsize:(left + count) * itemsize] = b
+        view[(right - count) * itemsize:right * itemsize] = a
+        left += count
+        right -= count
+    view.release()
+    return buf
+
+
+def _reversed_records(chunk, itemsize):
+    # Copy of one block with its records in reverse order (bytes inside a record keep their order)
+    if itemsize == 1:
+        return chunk.tobytes()[::-1]
+    records = typed_array({2: "H", 4: "I", 8: "Q"}.get(itemsize, "B"), chunk.tobytes())
+    if records.typecode != "B":
+        records.reverse()
+        return records.tobytes()
+    data = chunk.tobytes()
+    return b"".join(data[i:i + itemsize] for i in range(len(data) - itemsize, -1, -itemsize))
+
+# Example
+print(reverse_in_place(list(range(10)), 2, 6))                 # Output: [0, 1, 5, 4, 3, 2, 6, 7, 8, 9]
+print(reverse_in_place(typed_array("i", [1, 2, 3, 4])))       # Output: array('i', [4, 3, 2, 1])
+print(reverse_in_place(bytearray(b"abcdef"), block=2))         # Output: bytearray(b'fedcba')
+print(reverse_in_place(bytearray(b"aabbcc"), itemsize=2))      # Output: bytearray(b'ccbbaa')
+numbers = typed_array("q", [1, 2, 3])
+reverse_in_place(memoryview(numbers))                          # 8 byte records, taken from the view
+print(numbers)                                                 # Output: array('q', [3, 2, 1])
+
+# A file of fixed-size records, reversed on disk through mmap without reading it all into memory
+path = os.path.join(tempfile.mkdtemp(), "records.bin")
+with open(path, "wb") as f:
+    f.write(b"r1..r2..r3..r4..r5..")
+with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as m:
+    reverse_in_place(m, itemsize=4, block=8)
+with open(path, "rb") as f:
+    print(f.read())  # Output: b'r5..r4..r3..r2..r1..'
+os.remove(path)
+
+# Time Complexity: O(n) for all versions.
+# Space Complexity: reverse_array_recursive uses O(n) stack; reverse_in_place uses O(n) for one slice copy on
+# lists / arrays and O(block) for buffers and mmap.
@@ -37,3 +37,92 @@ def rotate_array(arr, k):
 
 # Example
 print(rotate_array([1, 2, 3, 4, 5], 2))  # Output: [4, 5, 1, 2, 3]
+
+
+# In place, O(n) time and O(1) extra memory (juggling / cycle leader): after a right rotation by k the element
+# at index i moves to (i + k) % n. Follow that chain from a start index, carrying one element, until the chain
+# comes back to where it started. There are gcd(n, k) such chains and together they move every element once.
+# Works on any mutable sequence: list, bytearray, array.array, NumPy arrays, memoryview of an mmap.
+def gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def rotate_right_in_place(arr, k):
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    if k == 0:
+        return arr
+    for start in range(gcd(n, k)):
+        carried = arr[start]
+        i = start
+        while True:
+            j = (i + k) % n
+            arr[j], carried = carried, arr[j]
+            i = j
+            if i == start:
+                break
+    return arr
+
+
+def rotate_left_in_place(arr, k):
+    n = len(arr)
+    return rotate_right_in_place(arr, n - k % n if n else 0)
+
+# Example
+print(rotate_right_in_place([1, 2, 3, 4, 5], 2))  # Output: [4, 5, 1, 2, 3]
+print(rotate_left_in_place([1, 2, 3, 4, 5], 2))   # Output: [3, 4, 5, 1, 2]
+
+
+# Lazy rotation: for a big ring buffer that is rotated again and again, don't move anything.
+# The view only remembers where the rotated array starts; rotating changes that offset in O(1) and
+# indexing maps i to (offset + i) % n. materialize() builds the rotated list when it is really needed.
+class RotatedView:
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.offset = offset % len(data) if len(data) else 0
+
+    def rotate_right(self, k):
+        if len(self.data):
+            self.offset = (self.offset - k) % len(self.data)
+        return self
+
+    def rotate_left(self, k):
+        return self.rotate_right(-k)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        n = len(self.data)
+        if not -n <= i < n:
+            raise IndexError("index out of range")
+        return self.data[(self.offset + i) % n]
+
+    def __iter__(self):
+        # index by index, so iterating never copies the data
+        n = len(self.data)
+        for i in range(self.offset, self.offset + n):
+            yield self.data[i % n]
+
+    def materialize(self):
+        return list(self.data[self.offset:]) + list(self.data[:self.offset])
+
+    def __repr__(self):
+        return f"RotatedView({self.materialize()})"
+
+# Example
+view = RotatedView([1, 2, 3, 4, 5])
+view.rotate_right(2).rotate_right(1).rotate_left(1)
+print(view[0], view.materialize())  # Output: 4 [4, 5, 1, 2, 3]
+
+
+# Time Complexity
+#   rotate_right_naive / rotate_left_naive: O(n * k).   rotate_array: O(n).
+#   rotate_right_in_place / rotate_left_in_place: O(n).
+#   RotatedView: rotate O(1), indexing O(1), materialize O(n).
+# Space Complexity
+#   rotate_array: O(n) new list.   rotate_*_in_place: O(1).   RotatedView: O(1) besides the data.
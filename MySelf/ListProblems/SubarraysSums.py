@@ -1,3 +1,9 @@
+import mmap
+import os
+from array import array as typed_array  # `array` is used as a variable name below
+from concurrent.futures import ProcessPoolExecutor
+
+
 def find_subarrays_brute_force(arr, target_sum):
     result = []
     for i in range(len(arr)):
@@ -24,3 +30,135 @@ def max_subarray_sum(arr):
 
 # Example
 print(max_subarray_sum([-2, 1, -3, 4, -1, 2, 1, -5, 4]))  # Output: 6
+
+
+
+# O(n) target sums with prefix sums: sum(arr[i:j]) == prefix[j] - prefix[i], so a subarray ending at j has the
+# target sum for every earlier prefix equal to prefix[j] - target_sum. A dict remembers where each prefix sum
+# occurred. Works for negative numbers too, and reads the input as a stream.
+def count_subarrays_with_sum(arr, target_sum):
+    seen = {0: 1}  # prefix sum -> how many times it occurred
+    prefix = 0
+    count = 0
+    for num in arr:
+        prefix += num
+        count += seen.get(prefix - target_sum, 0)
+        seen[prefix] = seen.get(prefix, 0) + 1
+    return count
+
+
+def iter_subarrays_with_sum(arr, target_sum):
+    # Yields (start, end) pairs, end exclusive, so arr[start:end] sums to target_sum; nothing is copied.
+    # Pairs come out ordered by end, then by start.
+    seen = {0: [0]}  # prefix sum -> positions where it occurred
+    prefix = 0
+    for end, num in enumerate(arr, 1):
+        prefix += num
+        for start in seen.get(prefix - target_sum, ()):
+            yield start, end
+        seen.setdefault(prefix, []).append(end)
+
+# Example
+array = [1, 2, 3, 4, 5]
+print(count_subarrays_with_sum(array, 5))        # Output: 2
+print(list(iter_subarrays_with_sum(array, 5)))   # Output: [(1, 3), (4, 5)]
+
+
+# Kadane with indexes, reading the input as a stream (any iterable, no arr[1:] copy).
+# Returns (best sum, start, end) with arr[start:end] being the best subarray.
+def max_subarray_with_indices(items):
+    best = None
+    current = 0
+    current_start = 0
+    for i, num in enumerate(items):
+        if i == 0 or current < 0:  # starting over beats extending a negative sum
+            current = num
+            current_start = i
+        else:
+            current += num
+        if best is None or current > best[0]:
+            best = (current, current_start, i + 1)
+    if best is None:
+        raise ValueError("empty input")
+    return best
+
+# Example
+print(max_subarray_with_indices(iter([-2, 1, -3, 4, -1, 2, 1, -5, 4])))  # Output: (6, 3, 7)
+
+
+# Divide and conquer Kadane: every chunk is summarised by (total, best prefix, best suffix, best), and two
+# neighbouring summaries combine in O(1). So chunks can be scanned in separate processes and merged at the end.
+def kadane_summary(chunk):
+    # One pass. Prefixes and suffixes are non-empty; best suffix = total - smallest proper prefix.
+    total = 0
+    best_prefix = best = None
+    smallest_prefix = 0  # smallest sum of chunk[:i] for i < len(chunk), the empty prefix included
+    current = 0
+    for num in chunk:
+        smallest_prefix = min(smallest_prefix, total)
+        total += num
+        best_prefix = total if best_prefix is None else max(best_prefix, total)
+        current = num if best is None or current < 0 else current + num
+        best = current if best is None else max(best, current)
+    return total, best_prefix, total - smallest_prefix, best
+
+
+def merge_summaries(left, right):
+    left_total, left_prefix, left_suffix, left_best = left
+    right_total, right_prefix, right_suffix, right_best = right
+    return (
+        left_total + right_total,
+        max(left_prefix, left_total + right_prefix),
+        max(right_suffix, right_total + left_suffix),
+        max(left_best, right_best, left_suffix + right_prefix),
+    )
+
+
+# Multi-GB series: a binary file of fixed-width numbers (typecode, native byte order). Only the file name and
+# the chunk bounds are sent to the workers; every worker maps the file with mmap and scans its own chunk,
+# so the data never goes through the pipes between processes.
+def _chunk_summary(path, typecode, start, stop):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        view = memoryview(m).cast(typecode)
+        try:
+            chunk = view[start:stop]
+            try:
+                return kadane_summary(chunk)
+            finally:
+                chunk.release()
+        finally:
+            view.release()
+
+
+def max_subarray_sum_file(path, typecode="q", workers=None, chunk_items=1 << 24):
+    itemsize = typed_array(typecode).itemsize
+    n = os.path.getsize(path) // itemsize
+    if n == 0:
+        raise ValueError("empty input")
+
+    starts = list(range(0, n, chunk_items))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = list(pool.map(_chunk_summary, [path] * len(starts), [typecode] * len(starts),
+                                  starts, [min(s + chunk_items, n) for s in starts]))
+    result = summaries[0]
+    for summary in summaries[1:]:
+        result = merge_summaries(result, summary)
+    return result[3]
+
+
+if __name__ == "__main__":  # worker processes import this file, so run the example only once
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "pnl.bin")
+    with open(path, "wb") as f:
+        typed_array("q", [-2, 1, -3, 4, -1, 2, 1, -5, 4]).tofile(f)
+    print(max_subarray_sum_file(path, "q", workers=2, chunk_items=2))  # Output: 6
+    os.remove(path)
+
+
+# Time Complexity
+#   find_subarrays_brute_force: O(n^2) (plus copying every match).   max_subarray_sum: O(n).
+#   count_subarrays_with_sum: O(n).   iter_subarrays_with_sum: O(n + number of pairs).
+#   max_subarray_with_indices: O(n).   max_subarray_sum_file: O(n / workers) per worker + O(chunks) merge.
+# Space Complexity
+#   count / iter_subarrays_with_sum: O(n) for the prefix dict.   Kadane versions: O(1) per chunk (the file is
+#   mapped, not copied).
@@ -1,5 +1,7 @@
 # Given an array of integers, find two numbers such that they add up to a specific target number.
 
+import bisect
+
 
 def two_sum(nums, target):
     seen = {}
@@ -14,4 +16,127 @@ nums = [2, 5,7, 11, 15,4]
 
 target = 9
 
-print(two_sum(nums,target))
\ No newline at end of file
+print(two_sum(nums,target))
+
+
+# Reusable index: build once, then ask for many targets.
+# positions maps every value to the sorted list of indexes where it appears, values holds the distinct values
+# in sorted order. NumPy arrays are accepted (converted to plain Python numbers once).
+class TwoSumIndex:
+    def __init__(self, nums):
+        if hasattr(nums, "tolist"):
+            nums = nums.tolist()
+        self.nums = list(nums)
+        self.positions = {}
+        for i, num in enumerate(self.nums):
+            self.positions.setdefault(num, []).append(i)
+        self.values = sorted(self.positions)
+
+    def first_pair(self, target):
+        # Same answer as two_sum(nums, target): the pair whose second index is smallest,
+        # with the latest earlier index of the complement.
+        positions = self.positions
+        for j, num in enumerate(self.nums):
+            earlier = positions.get(target - num)
+            if earlier and earlier[0] < j:
+                return [earlier[bisect.bisect_left(earlier, j) - 1], j]
+        return []
+
+    def all_pairs(self, target, method="auto"):
+        # Every index pair (i, j), i < j, with nums[i] + nums[j] == target.
+        # "hash": look up the complement of each distinct value. "sorted": two pointers over the sorted
+        # distinct values, no hashing. Both are O(distinct values + pairs); "auto" picks two pointers
+        # for big inputs, where walking one sorted list is cheaper than a dict lookup per value.
+        if method == "auto":
+            method = "sorted" if len(self.values) > 1 << 16 else "hash"
+        if method == "hash":
+            matches = [(v, target - v) for v in self.values if v <= target - v and target - v in self.positions]
+        elif method == "sorted":
+            matches = []
+            left, right = 0, len(self.values) - 1
+            while left <= right:
+                total = self.values[left] + self.values[right]
+                if total == target:
+                    matches.append((self.values[left], self.values[right]))
+                    left += 1
+                    right -= 1
+                elif total < target:
+                    left += 1
+                else:
+                    right -= 1
+        else:
+            raise ValueError("method must be 'auto', 'hash' or 'sorted'")
+
+        pairs = []
+        for a, b in matches:
+            if a == b:
+                same = self.positions[a]
+                pairs.extend((same[x], same[y]) for x in range(len(same)) for y in range(x + 1, len(same)))
+            else:
+                pairs.extend((min(i, j), max(i, j)) for i in self.positions[a] for j in self.positions[b])
+        return sorted(pairs)
+
+    def batch(self, targets, all_pairs=False, method="auto"):
+        # {target: answer} for many targets, reusing the same index
+        if hasattr(targets, "tolist"):
+            targets = targets.tolist()
+        if all_pairs:
+            return {t: self.all_pairs(t, method) for t in targets}
+        return {t: self.first_pair(t) for t in targets}
+
+    def k_sum(self, k, target):
+        # Distinct value combinations a <= b <= ... of k numbers from the list that add up to target
+        # (3-sum, 4-sum, ...). Sort once, fix the smallest value, recurse on k - 1, finish with two pointers.
+        # Pruning: stop when the k smallest remaining values are already too big; skip a value when it plus
+        # the k - 1 largest values is still too small.
+        counts = {v: len(p) for v, p in self.positions.items()}
+        items = []  # sorted values, each repeated at most k times (enough for any combination)
+        for v in self.values:
+            items.extend([v] * min(counts[v], k))
+        result = []
+        self._k_sum(items, 0, k, target, [], result)
+        return result
+
+    def _k_sum(self, items, start, k, target, chosen, result):
+        n = len(items)
+        if n - start < k:
+            return
+        if k == 2:
+            left, right = start, n - 1
+            while left < right:
+                total = items[left] + items[right]
+                if total == target:
+                    result.append(tuple(chosen + [items[left], items[right]]))
+                    left += 1
+                    while left < right and items[left] == items[left - 1]:
+                        left += 1
+                    right -= 1
+                elif total < target:
+                    left += 1
+                else:
+                    right -= 1
+            return
+        for i in range(start, n - k + 1):
+            if i > start and items[i] == items[i - 1]:
+                continue
+            if sum(items[i:i + k]) > target:  # the k smallest choices are already too big
+                break
+            if items[i] + sum(items[n - k + 1:]) < target:  # even with the largest values it is too small
+                continue
+            self._k_sum(items, i + 1, k - 1, target - items[i], chosen + [items[i]], result)
+
+# Example
+index = TwoSumIndex([2, 5, 7, 11, 15, 4, 2, 7])
+print(index.first_pair(9))                  # Output: [0, 2]
+print(index.all_pairs(9))                   # Output: [(0, 2), (0, 7), (1, 5), (2, 6), (6, 7)]
+print(index.batch([9, 22, 100]))            # Output: {9: [0, 2], 22: [2, 4], 100: []}
+print(index.k_sum(3, 16))                   # Output: [(2, 7, 7), (4, 5, 7)]
+print(index.k_sum(4, 16))                   # Output: [(2, 2, 5, 7)]
+
+
+# Time Complexity
+#   two_sum: O(n) per target (the dict is rebuilt every call).
+#   TwoSumIndex: build O(n log n); first_pair O(n) per target with no rebuilding; all_pairs O(d + pairs)
+#   for d distinct values; k_sum O(d^(k-1)) in the worst case, usually much less thanks to the pruning.
+# Space Complexity
+#   TwoSumIndex: O(n) for the positions, built once.
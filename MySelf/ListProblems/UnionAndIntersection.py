@@ -1,4 +1,15 @@
-def find_union_and_intersection(arr1, arr2):
+import bisect
+import heapq
+import struct
+from array import array
+
+
+def find_union_and_intersection(arr1, arr2, backend="set"):
+    if backend == "bitmap":
+        # Compressed integer sets (RoaringBitmap below); inputs that already are bitmaps are used as they are
+        a = arr1 if isinstance(arr1, RoaringBitmap) else RoaringBitmap(arr1)
+        b = arr2 if isinstance(arr2, RoaringBitmap) else RoaringBitmap(arr2)
+        return list(a | b), list(a & b)
     # Using sets for union and intersection
     union = list(set(arr1) | set(arr2))  # Union using set union operator
     intersection = list(set(arr1) & set(arr2))  # Intersection using set intersection operator
@@ -49,3 +60,338 @@ arr2 = [3, 4, 4, 5, 6]
 union, intersection = find_union_and_intersection_sorted(arr1, arr2)
 print("Union:", union)
 print("Intersection:", intersection)
+
+
+
+# Streaming set operations over any number of already sorted inputs (lists, arrays, generators, files).
+# Nothing is sorted again and no intermediate list is built: values are produced one by one, in order,
+# without duplicates.
+_END = object()
+
+
+def sorted_union(*inputs):
+    last = _END
+    for value in heapq.merge(*inputs):
+        if last is _END or value != last:
+            yield value
+            last = value
+
+
+def sorted_difference(first, *others):
+    # Values of `first` that are in none of the other inputs
+    rest = sorted_union(*others)
+    other = next(rest, _END)
+    last = _END
+    for value in first:
+        if last is not _END and value == last:
+            continue
+        last = value
+        while other is not _END and other < value:
+            other = next(rest, _END)
+        if other is _END or other != value:
+            yield value
+
+
+def sorted_intersection(*inputs):
+    if not inputs:
+        return
+    if all(hasattr(x, "__getitem__") and hasattr(x, "__len__") for x in inputs):
+        yield from _galloping_intersection(inputs)
+        return
+    # Plain iterators: "leapfrog" - every input jumps forward to the largest current value until all agree.
+    iterators = [iter(x) for x in inputs]
+    current = [next(it, _END) for it in iterators]
+    if any(value is _END for value in current):
+        return
+    while True:
+        high = max(current)
+        for i, it in enumerate(iterators):
+            while current[i] < high:
+                current[i] = next(it, _END)
+                if current[i] is _END:
+                    return
+        if all(value == high for value in current):
+            yield high
+            for i, it in enumerate(iterators):  # move past this value (and its copies)
+                while current[i] == high:
+                    current[i] = next(it, _END)
+                    if current[i] is _END:
+                        return
+
+
+def gallop(arr, target, start):
+    # Smallest index >= start with arr[index] >= target. Checks start, start + 1, start + 2, start + 4, ...
+    # and then binary searches the last gap: O(log distance) instead of O(log n).
+    n = len(arr)
+    step = 1
+    low = start
+    high = start
+    while high < n and arr[high] < target:
+        low = high + 1
+        high = start + step
+        step *= 2
+    return bisect.bisect_left(arr, target, low, min(high, n))
+
+
+def _galloping_intersection(lists):
+    # Walk the shortest list and gallop in the others, so a 100 element list against a 100M element one costs
+    # about 100 * log(100M / 100) probes instead of 100M steps.
+    lists = sorted(lists, key=len)
+    shortest, others = lists[0], lists[1:]
+    positions = [0] * len(others)
+    last = _END
+    for value in shortest:
+        if last is not _END and value == last:
+            continue
+        last = value
+        found = True
+        for k, arr in enumerate(others):
+            positions[k] = gallop(arr, value, positions[k])
+            if positions[k] == len(arr):
+                return
+            if arr[positions[k]] != value:
+                found = False
+                break
+        if found:
+            yield value
+
+
+def read_sorted_numbers(path):
+    # One number per line, read lazily, so a sorted file can be an input too
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield int(line)
+
+# Example
+arr1 = [1, 2, 2, 3, 4]
+arr2 = [3, 4, 4, 5, 6]
+arr3 = [0, 4, 6]
+print(list(sorted_union(arr1, arr2, arr3)))                # Output: [0, 1, 2, 3, 4, 5, 6]
+print(list(sorted_intersection(arr1, arr2)))               # Output: [3, 4]
+print(list(sorted_intersection(iter(arr1), iter(arr2), iter(arr3))))  # Output: [4]
+print(list(sorted_difference(arr2, arr1)))                 # Output: [5, 6]
+print(list(sorted_intersection([5, 500000], range(0, 10 ** 8, 5))))  # Output: [5, 500000]
+
+
+# Time Complexity
+#   sorted_union / sorted_difference: O(N log k) for N values in k inputs (heap merge).
+#   sorted_intersection: O(N) for iterators; with indexable inputs O(m log(n / m)) for the shortest length m.
+# Space Complexity
+#   O(k), one current value per input.
+
+
+
+# Compressed integer set (the "roaring bitmap" idea) for ids 0 .. 2^32 - 1.
+# A Python set costs 60+ bytes per integer. Here ids are grouped by their high 16 bits into chunks of 65536 ids,
+# and every chunk picks the cheaper of two containers:
+#   - array container:  sorted array('H') of the low 16 bits, 2 bytes per id, used up to 4096 ids
+#   - bitmap container: one bit per possible id (8 KB), stored as a Python int, used above 4096 ids
+# Set operations work chunk by chunk: bitmaps with big-integer &, |, & ~ (done in C), small arrays with
+# set operations. Serialized bytes can be written to a file and read back straight from an mmap.
+ARRAY_LIMIT = 4096
+MAGIC = b"RBM1"
+
+
+# _BYTE_BITS[b] = positions of the 1 bits in the byte b, used to list the ids of a bitmap a byte at a time
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _to_container(low_values):
+    # low_values: sorted list of distinct ints in 0..65535
+    if len(low_values) > ARRAY_LIMIT:
+        return _as_bits(low_values)
+    return array("H", low_values)
+
+
+def _low_values(container):
+    if isinstance(container, array):
+        return container
+    # Shifting the 8 KB int once per bit would copy it 65536 times; walk its bytes instead
+    data = container.to_bytes(8192, "little")
+    return [8 * i + bit for i, byte in enumerate(data) if byte for bit in _BYTE_BITS[byte]]
+
+
+def _as_bits(container):
+    if isinstance(container, int):
+        return container
+    # Set the bits in a bytearray and convert once, instead of building a new 8 KB int per id
+    data = bytearray(8192)
+    for x in container:
+        data[x >> 3] |= 1 << (x & 7)
+    return int.from_bytes(data, "little")
+
+
+def _cardinality(container):
+    return container.bit_count() if isinstance(container, int) else len(container)
+
+
+def _normalize(bits_or_values):
+    # Pick the right container for the result of an operation (None when it is empty)
+    if isinstance(bits_or_values, int):
+        count = bits_or_values.bit_count()
+        if count == 0:
+            return None
+        if count > ARRAY_LIMIT:
+            return bits_or_values
+        return array("H", _low_values(bits_or_values))
+    return _to_container(bits_or_values) if bits_or_values else None
+
+
+class RoaringBitmap:
+    def __init__(self, values=()):
+        self.containers = {}  # high 16 bits -> container
+        chunk_key, chunk = None, []
+        for x in sorted(set(values)):
+            if not 0 <= x < 1 << 32:
+                raise ValueError(f"{x} is outside 0 .. 2^32 - 1")
+            key = x >> 16
+            if key != chunk_key:
+                if chunk:
+                    self.containers[chunk_key] = _to_container(chunk)
+                chunk_key, chunk = key, []
+            chunk.append(x & 0xFFFF)
+        if chunk:
+            self.containers[chunk_key] = _to_container(chunk)
+
+    def add(self, x):
+        if not 0 <= x < 1 << 32:
+            raise ValueError(f"{x} is outside 0 .. 2^32 - 1")
+        key, low = x >> 16, x & 0xFFFF
+        container = self.containers.get(key)
+        if container is None:
+            self.containers[key] = array("H", [low])
+        elif isinstance(container, int):
+            self.containers[key] = container | 1 << low
+        else:
+            i = bisect.bisect_left(container, low)
+            if i == len(container) or container[i] != low:
+                container.insert(i, low)
+                if len(container) > ARRAY_LIMIT:
+                    self.containers[key] = _as_bits(container)
+
+    def __contains__(self, x):
+        container = self.containers.get(x >> 16)
+        if container is None:
+            return False
+        low = x & 0xFFFF
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        i = bisect.bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def __len__(self):
+        return sum(_cardinality(c) for c in self.containers.values())
+
+    def __iter__(self):
+        for key in sorted(self.containers):
+            base = key << 16
+            for low in _low_values(self.containers[key]):
+                yield base + low
+
+    def _combine(self, other, keys, op):
+        result = RoaringBitmap()
+        for key in keys:
+            a, b = self.containers.get(key), other.containers.get(key)
+            if a is None or b is None:
+                container = op(a, b)
+                if isinstance(container, array):
+                    # Passed through from an operand: copy it, or add() on the result would change the operand
+                    # too (bitmap ints are immutable and can be shared)
+                    container = array("H", container)
+            elif isinstance(a, array) and isinstance(b, array):
+                container = _normalize(sorted(op(set(a), set(b))))
+            else:
+                container = _normalize(op(_as_bits(a), _as_bits(b)))
+            if container is not None:
+                result.containers[key] = container
+        return result
+
+    def __or__(self, other):
+        def union(a, b):
+            if a is None or b is None:
+                return a if b is None else b
+            return a | b
+        return self._combine(other, self.containers.keys() | other.containers.keys(), union)
+
+    def __and__(self, other):
+        def intersection(a, b):
+            if a is None or b is None:
+                return None
+            return a & b
+        return self._combine(other, self.containers.keys() & other.containers.keys(), intersection)
+
+    def __sub__(self, other):
+        def difference(a, b):
+            if b is None:
+                return a
+            if isinstance(a, int):
+                return a & ~b
+            return a - b
+        return self._combine(other, self.containers.keys(), difference)
+
+    def __eq__(self, other):
+        return isinstance(other, RoaringBitmap) and list(self) == list(other)
+
+    def to_bytes(self):
+        # MAGIC, number of containers, then for each: key, kind (0 array / 1 bitmap), count, data
+        parts = [MAGIC, struct.pack("<I", len(self.containers))]
+        for key in sorted(self.containers):
+            container = self.containers[key]
+            if isinstance(container, int):
+                parts.append(struct.pack("<HBI", key, 1, container.bit_count()))
+                parts.append(container.to_bytes(8192, "little"))
+            else:
+                parts.append(struct.pack("<HBI", key, 0, len(container)))
+                data = array("H", container)
+                if struct.pack("=H", 1) != struct.pack("<H", 1):  # stored little-endian on every machine
+                    data.byteswap()
+                parts.append(data.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        # buffer: bytes, bytearray, or an mmap of a file written with to_bytes()
+        view = memoryview(buffer)
+        if bytes(view[:4]) != MAGIC:
+            raise ValueError("not a serialized RoaringBitmap")
+        (count,) = struct.unpack_from("<I", view, 4)
+        offset = 8
+        result = cls()
+        for _ in range(count):
+            key, kind, cardinality = struct.unpack_from("<HBI", view, offset)
+            offset += struct.calcsize("<HBI")
+            if kind == 1:
+                result.containers[key] = int.from_bytes(view[offset:offset + 8192], "little")
+                offset += 8192
+            else:
+                data = array("H")
+                data.frombytes(view[offset:offset + 2 * cardinality])
+                if struct.pack("=H", 1) != struct.pack("<H", 1):
+                    data.byteswap()
+                result.containers[key] = data
+                offset += 2 * cardinality
+        view.release()
+        return result
+
+    def memory_bytes(self):
+        # Approximate size of the data itself (containers only)
+        return sum(8192 if isinstance(c, int) else 2 * len(c) for c in self.containers.values())
+
+# Example
+ids = RoaringBitmap(range(0, 100000, 3))
+other = RoaringBitmap([3, 6, 7, 70000, 1 << 31])
+print(len(ids), len(ids & other), list(ids & other))       # Output: 33334 2 [3, 6]
+print(len(ids | other), list(other - ids))                 # Output: 33337 [7, 70000, 2147483648]
+print(RoaringBitmap.from_bytes(other.to_bytes()) == other) # Output: True
+print(ids.memory_bytes())                                  # Output: 16384 (two bitmap chunks, ~0.5 byte per id)
+
+union, intersection = find_union_and_intersection([1, 2, 2, 3, 4], [3, 4, 4, 5, 6], backend="bitmap")
+print("Union:", union)                                     # Output: Union: [1, 2, 3, 4, 5, 6]
+print("Intersection:", intersection)                       # Output: Intersection: [3, 4]
+
+# Time Complexity
+#   RoaringBitmap build: O(n log n) (sort). add / contains: O(log 4096) at most.
+#   union / intersection / difference: per chunk O(4096) for arrays, O(8 KB) big-integer ops for bitmaps.
+# Space Complexity
+#   2 bytes per id in sparse chunks, at most 8 KB per 65536-id chunk when dense.
@@ -1,3 +1,5 @@
+import re
+
 def excel_column_to_number(column_name):
     column_number = 0
     for char in column_name:
@@ -8,3 +10,103 @@ def excel_column_to_number(column_name):
 print(excel_column_to_number("A"))   # Output: 1
 print(excel_column_to_number("AB"))  # Output: 28
 print(excel_column_to_number("ABC")) # Output: 731
+
+
+# Inverse: number -> column name. Column names are "bijective base 26" (A = 1 ... Z = 26, no zero digit),
+# so subtract 1 before every division.
+def number_to_excel_column(column_number):
+    if column_number < 1:
+        raise ValueError("column numbers start at 1")
+    name = []
+    while column_number:
+        column_number, remainder = divmod(column_number - 1, 26)
+        name.append(chr(ord("A") + remainder))
+    return "".join(reversed(name))
+
+# Examples
+print(number_to_excel_column(28))     # Output: AB
+print(number_to_excel_column(16384))  # Output: XFD
+
+
+# Precomputed tables for every column a workbook can have (A .. XFD = 16384): both directions become one lookup.
+MAX_COLUMN = 16384
+MAX_ROW = 1048576
+COLUMN_NAMES = [""] + [number_to_excel_column(n) for n in range(1, MAX_COLUMN + 1)]
+COLUMN_NUMBERS = {name: n for n, name in enumerate(COLUMN_NAMES) if n}
+
+
+def column_to_number(column_name):
+    number = COLUMN_NUMBERS.get(column_name) or COLUMN_NUMBERS.get(column_name.upper())
+    if number is None:
+        raise ValueError(f"invalid column {column_name!r} (A .. XFD)")
+    return number
+
+
+# A1 style references: "B3", "$B$3", ranges "B3:AZ1000". Cells are returned as (row, column) numbers.
+CELL_PATTERN = re.compile(r"\$?([A-Za-z]{1,3})\$?([1-9][0-9]{0,6})")
+
+
+def parse_cell(reference):
+    match = CELL_PATTERN.fullmatch(reference)
+    if match is None:
+        raise ValueError(f"invalid cell reference {reference!r}")
+    row = int(match.group(2))
+    if row > MAX_ROW:
+        raise ValueError(f"row {row} is past the last row {MAX_ROW}")
+    return row, column_to_number(match.group(1))
+
+
+def cell_name(row, column):
+    if not 1 <= column <= MAX_COLUMN:
+        raise ValueError(f"column {column} is outside 1 .. {MAX_COLUMN}")
+    if not 1 <= row <= MAX_ROW:
+        raise ValueError(f"row {row} is outside 1 .. {MAX_ROW}")
+    return f"{COLUMN_NAMES[column]}{row}"
+
+
+def parse_range(reference):
+    # "B3:AZ1000" -> ((3, 2), (1000, 52)); corners are put in top-left / bottom-right order.
+    # A single cell "B3" is the range B3:B3; "B3:" with nothing after the colon is an error.
+    first, colon, last = reference.partition(":")
+    if colon and not last:
+        raise ValueError(f"invalid range {reference!r}: nothing after ':'")
+    row1, col1 = parse_cell(first)
+    row2, col2 = parse_cell(last) if colon else (row1, col1)
+    return (min(row1, row2), min(col1, col2)), (max(row1, row2), max(col1, col2))
+
+
+def iter_range(reference):
+    # Every (row, column) of a range, row by row, produced lazily (a whole-sheet range would be 17 billion cells)
+    (row1, col1), (row2, col2) = parse_range(reference)
+    for row in range(row1, row2 + 1):
+        for column in range(col1, col2 + 1):
+            yield row, column
+
+
+# Batch API: many references at once
+def parse_cells(references):
+    return [parse_cell(reference) for reference in references]
+
+
+def iter_cells(references):
+    # Cells and ranges mixed, ranges expanded lazily
+    for reference in references:
+        if ":" in reference:
+            yield from iter_range(reference)
+        else:
+            yield parse_cell(reference)
+
+# Examples
+print(column_to_number("xfd"))               # Output: 16384
+print(parse_cell("$B$3"))                    # Output: (3, 2)
+print(cell_name(1000, 52))                   # Output: AZ1000
+print(parse_range("AZ1000:B3"))              # Output: ((3, 2), (1000, 52))
+print(list(iter_cells(["A1", "C2:D3"])))     # Output: [(1, 1), (2, 3), (2, 4), (3, 3), (3, 4)]
+
+
+# Time Complexity
+#   excel_column_to_number / number_to_excel_column: O(length of the name).
+#   column_to_number / cell_name: O(1) table lookups. parse_cell: O(length of the reference).
+#   iter_range: O(1) per produced cell.
+# Space Complexity
+#   Tables: 16384 names and numbers, built once. iter_range / iter_cells: O(1).
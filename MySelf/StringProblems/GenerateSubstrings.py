@@ -9,3 +9,48 @@ def generate_substrings(s: str):
 s = "abcdxyzxb"
 result = generate_substrings(s)
 print(result)
+
+
+
+# Lazy version: generate_substrings keeps every substring in memory at once (O(n^3) characters in total).
+# Here substrings are described by (start, end) indexes (end is exclusive) and produced one at a time in the
+# same order, so the caller can filter by length or any predicate before a string is built.
+def iter_substrings_indexes(n, min_len=1, max_len=None, predicate=None):
+    min_len = max(min_len, 1)  # the empty string is not counted as a substring
+    if max_len is None or max_len > n:
+        max_len = n
+    for i in range(n):
+        for j in range(i + min_len, min(i + max_len, n) + 1):
+            if predicate is None or predicate(i, j):
+                yield i, j
+
+
+def iter_substrings(s, min_len=1, max_len=None, predicate=None):
+    # A str slice is always a copy; for bytes / bytearray input a memoryview slice is returned instead.
+    view = memoryview(s) if isinstance(s, (bytes, bytearray)) else s
+    for i, j in iter_substrings_indexes(len(s), min_len, max_len, predicate):
+        yield view[i:j]
+
+# Example
+s = "abcdxyzxb"
+print(list(iter_substrings(s, min_len=8)))  # Output: ['abcdxyzx', 'abcdxyzxb', 'bcdxyzxb']
+print(next(iter_substrings(s, predicate=lambda i, j: s[i] == s[j - 1] and j - i > 1)))  # Output: bcdxyzxb
+
+
+# Count only: a string of n characters has n - L + 1 substrings of length L, n(n+1)/2 in total.
+# With a predicate every (start, end) pair is tested, but no substring is built.
+def count_substrings(n, min_len=1, max_len=None, predicate=None):
+    min_len = max(min_len, 1)  # must agree with iter_substrings_indexes
+    if max_len is None or max_len > n:
+        max_len = n
+    if predicate is not None:
+        return sum(1 for _ in iter_substrings_indexes(n, min_len, max_len, predicate))
+    if min_len > max_len:
+        return 0
+    # sum of (n - L + 1) for L = min_len .. max_len
+    terms = max_len - min_len + 1
+    return terms * (n + 1) - (min_len + max_len) * terms // 2
+
+# Example
+print(count_substrings(len(s)))                    # Output: 45
+print(count_substrings(len(s), max_len=2))         # Output: 17